@@ -35,7 +35,7 @@ def contact_view(request):
             email = form.cleaned_data['email']
             message = form.cleaned_data['message']
             # You can save the data to the database, send an email, etc.
-            logger.info(f"Validated Form Data: {name}, {email}, {message}")
+            logger.info("Validated Form Data: %s, %s, %s", name, email, message)
             return HttpResponse('Thank you for your message.')
     else:
         # If the request method is GET, create an empty form instance
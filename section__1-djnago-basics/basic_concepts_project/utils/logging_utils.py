@@ -1,11 +1,65 @@
 # utils/logging_utils.py
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+
+# One queue per log file, each drained by a single background QueueListener.
+# Level filtering happens on the loggers, so loggers with different levels
+# writing to the same file share one handler and one buffer.
+_log_queues = {}
+_log_queues_lock = threading.Lock()
+
+
+def _get_log_queue(log_file):
+    """
+    Return the queue feeding the listener for `log_file`, starting it if needed.
+
+    Args:
+        log_file (str): The file to which logs should be written.
+
+    Returns:
+        queue.Queue: Queue consumed by the listener thread.
+    """
+    with _log_queues_lock:
+        if log_file not in _log_queues:
+            # Create formatter
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+            # Create console handler with a higher log level
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.ERROR)
+            console_handler.setFormatter(formatter)
+            handlers = [console_handler]
+
+            # If a log file is specified, add a file handler buffered to flush
+            # every 256 records (or immediately on ERROR)
+            if log_file:
+                file_handler = logging.FileHandler(log_file)
+                file_handler.setFormatter(formatter)
+                handlers.append(logging.handlers.MemoryHandler(
+                    capacity=256, flushLevel=logging.ERROR, target=file_handler
+                ))
+
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            _log_queues[log_file] = log_queue
+
+        return _log_queues[log_file]
+
 
 def setup_logger(name, log_file, level=logging.INFO):
     """
     Function to setup a logger.
 
+    Records are put on a queue and written by a background listener, so
+    logging calls don't block on file I/O. They do not propagate to the
+    root logger, so each record is emitted exactly once.
+
     Args:
         name (str): The name of the logger.
         log_file (str): The file to which logs should be written.
@@ -17,23 +71,10 @@ def setup_logger(name, log_file, level=logging.INFO):
     # Create a logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
 
-    # Create file handler which logs even debug messages
-    fh = logging.FileHandler(log_file)
-    fh.setLevel(level)
-
-    # Create console handler with a higher log level
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.ERROR)
-
-    # Create formatter and add it to the handlers
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    fh.setFormatter(formatter)
-    ch.setFormatter(formatter)
-
-    # Add the handlers to the logger
+    # Add the queue handler to the logger
     if not logger.handlers:
-        logger.addHandler(fh)
-        logger.addHandler(ch)
+        logger.addHandler(logging.handlers.QueueHandler(_get_log_queue(log_file)))
 
     return logger
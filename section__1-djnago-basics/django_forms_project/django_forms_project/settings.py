@@ -69,6 +69,13 @@ MIDDLEWARE = [
 ROOT_URLCONF = 'django_forms_project.urls'
 
 TEMPLATES = [
+    # Jinja2 is listed first so the app-level `jinja2/` templates win the lookup
+    # for the form/list views; the admin keeps using the DTL backend below.
+    {
+        'BACKEND': 'django.template.backends.jinja2.Jinja2',
+        'DIRS': [],
+        'APP_DIRS': True,
+    },
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
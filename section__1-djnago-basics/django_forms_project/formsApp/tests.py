@@ -1,3 +1,26 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Author, Book
+
+
+class ManageBooksViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(name="J.K. Rowling", email="jk@example.com")
+        cls.book = Book.objects.create(title="Philosopher's Stone", author=cls.author)
+
+    def test_get_renders_author_books_formset(self):
+        # One query for the book joined with its author, one for the formset's books
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/book-and-authors/{self.book.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        # The formset is bound to the book's author, so the author's one book is an initial form
+        self.assertContains(response, 'name="book_set-INITIAL_FORMS" value="1"')
+        self.assertContains(response, 'value="Philosopher&#x27;s Stone"')
+
+    def test_unknown_book_returns_404(self):
+        response = self.client.get(f"/book-and-authors/{self.book.id + 1}/")
+
+        self.assertEqual(response.status_code, 404)
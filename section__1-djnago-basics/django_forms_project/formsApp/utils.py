@@ -1,34 +1,74 @@
 # logger.py
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
+
+# One queue per log file (None meaning console only), each drained by a
+# single background QueueListener. Level filtering happens on the loggers, so
+# loggers with different levels writing to the same file share one handler
+# and one buffer.
+_log_queues = {}
+_log_queues_lock = threading.Lock()
+
+
+def _get_log_queue(log_file):
+    """
+    Return the queue feeding the listener for `log_file`, starting it if needed.
+
+    :param log_file: File path for logging. If None, only console output is used.
+    :return: queue.Queue consumed by the listener thread.
+    """
+    with _log_queues_lock:
+        if log_file not in _log_queues:
+            # Create formatter
+            formatter = logging.Formatter('[%(asctime)s] %(levelname)s [%(name)s:%(lineno)s] %(message)s',
+                                          datefmt='%Y-%m-%d %H:%M:%S')
+
+            # Create console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            handlers = [console_handler]
+
+            # If a log file is specified, add a file handler buffered to flush
+            # every 256 records (or immediately on ERROR)
+            if log_file:
+                file_handler = logging.FileHandler(log_file)
+                file_handler.setFormatter(formatter)
+                handlers.append(logging.handlers.MemoryHandler(
+                    capacity=256, flushLevel=logging.ERROR, target=file_handler
+                ))
+
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            _log_queues[log_file] = log_queue
+
+        return _log_queues[log_file]
+
 
 def setup_logger(name, log_file=None, level=logging.INFO):
     """
     Setup a logger with the given name, log file, and level.
-    
+
+    Records are handed to a background listener through a queue, so the
+    calling thread never blocks on console or file I/O. They do not
+    propagate to the root logger, so each record is emitted exactly once.
+
     :param name: Logger name, usually __name__.
     :param log_file: File path for logging. If None, only console output is used.
     :param level: Logging level, e.g., logging.INFO, logging.DEBUG.
     :return: Configured logger.
     """
-    
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter('[%(asctime)s] %(levelname)s [%(name)s:%(lineno)s] %(message)s',
-                                  datefmt='%Y-%m-%d %H:%M:%S')
-    
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(console_handler)
-    
-    # If a log file is specified, add a file handler
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
+    logger.propagate = False
+
+    if not logger.handlers:
+        logger.addHandler(logging.handlers.QueueHandler(_get_log_queue(log_file)))
+
     return logger
@@ -1,4 +1,5 @@
-from django.shortcuts import render
+import logging
+from django.shortcuts import render, get_object_or_404
 from django.http import HttpResponse
 from .forms import ContactForm, PersonForm, AuthorForm, AuthorBookFormSet
 from .utils import setup_logger
@@ -7,13 +8,16 @@ from .models import Book, Author
 
 logger = setup_logger(__name__)
 
+# Built once at import rather than on every manage_authors request
+AuthorFormSet = formset_factory(AuthorForm, extra=3)
+
 def contact_view(request):
     if request.method == 'POST':
         form = ContactForm(request.POST)
         if form.is_valid():
             # Process the form data
             subject = f"Message from {form.cleaned_data['name']}"
-            logger.info(f"Received form data: {subject}")
+            logger.info("Received form data: %s", subject)
             message = form.cleaned_data['message']
             # Send email or perform other actions
             return render(request, 'formsApp/contact_success.html')
@@ -27,7 +31,7 @@ def person_view(request):
         form = PersonForm(request.POST)
         if form.is_valid():
 
-            logger.info(f"Form Data Validated: {form.cleaned_data}")
+            logger.info("Form Data Validated: %s", form.cleaned_data)
 
             return HttpResponse("The form data received and cleaned.")
         
@@ -38,28 +42,30 @@ def person_view(request):
 
 
 def manage_authors(request):
-    AuthorFormSet = formset_factory(AuthorForm, extra=3)
 
     if request.method == "POST":
         formset = AuthorFormSet(request.POST)
         if formset.is_valid():
-            # Process formset data
-            for form in formset:
-                logger.info(form.cleaned_data)
+            # Process formset data, logging every form's data in a single record
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("formset cleaned: %r", [form.cleaned_data for form in formset])
     else:
         formset = AuthorFormSet()
 
     return render(request, 'formsApp/manage_authors.html', {'formset': formset})
 
 def manage_books(request, book_id):
-    book = Book.objects.get(id=book_id)
+    # Join the author in the same query; it is the parent instance of the formset.
+    # Only the book's pk and author_id are needed, so its other columns are deferred.
+    book = get_object_or_404(Book.objects.select_related('author').only('author'), id=book_id)
    # AuthorFormSet = inlineformset_factory(Book, Author, fields=('name', 'email'), extra=2)
 
+    # AuthorBookFormSet is keyed on Author, so bind it to the book's author
     if request.method == "POST":
-        formset = AuthorBookFormSet(request.POST, instance=book)
+        formset = AuthorBookFormSet(request.POST, instance=book.author)
         if formset.is_valid():
             formset.save()
     else:
-        formset = AuthorBookFormSet(instance=book)
+        formset = AuthorBookFormSet(instance=book.author)
 
-    return render(request, 'manage_books.html', {'formset': formset})
+    return render(request, 'formsApp/manage_books.html', {'formset': formset})
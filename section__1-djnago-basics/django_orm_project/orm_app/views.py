@@ -94,15 +94,12 @@ from django.shortcuts import render
 from rest_framework import status
 from .models import Author, Book
 import logging
+from django.db.models import Prefetch
 from django.db.models.aggregates import Avg, Count
-# Define a logging format that includes the date, time, level, function name, and the log message
-LOG_FORMAT = "%(asctime)s - %(levelname)s - [%(funcName)s] - %(message)s"
-
-# Configure logging with the specified format and the date format
-logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+from utils.loggers import setup_logger
 
 # Get a logger instance with the specified name
-logger = logging.getLogger(__name__)
+logger = setup_logger(__name__)
 
 
 
@@ -111,22 +108,22 @@ class PracticeQueriesView(APIView):
 
     def get(self, request, format=None): 
 
-        # Getting all books using a given author
-        author = Author.objects.get(name="J.K. Rowling") 
-        # Listing all books written a by a given author
+        # Getting all books using a given author; the books are fetched up front in
+        # one extra query. `author` stays in `only()` because the prefetch matches
+        # the books back to the author through `author_id`.
+        author = Author.objects.prefetch_related(
+            Prefetch('book_set', queryset=Book.objects.only('title', 'author'))
+        ).get(name="J.K. Rowling")
+        # Listing all books written a by a given author (served from the prefetch cache)
         all_books = author.book_set.all()
 
-        logger.info(f"Showing titel of the all retrieved books: ")
-        for book in all_books:
-            logger.info(f"{book.title}")
-
-        # Annotate each author with the number of books they have written
-        authors = Author.objects.annotate(book_count=Count('book'))
-        logger.info(f"Author query set after annotation: {authors}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Showing titel of the all retrieved books: %s", ", ".join(book.title for book in all_books))
 
-        # Annotate each author with count and convert in dictionary
-        authors = Author.objects.annotate(book_count=Count('book')).values()
-        logger.info(f"Annotated author Queries after conversion to dictionary: {authors}")
+        # Annotate each author with the number of books they have written, as plain
+        # (id, name, book_count) tuples since the rows are only logged
+        authors = Author.objects.annotate(book_count=Count('book')).values_list('id', 'name', 'book_count')
+        logger.info("Annotated author Queries as tuples: %s", authors)
 
         # for a in author:
         #     logging.info(f"Author name: {a.name}")
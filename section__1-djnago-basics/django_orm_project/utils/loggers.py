@@ -0,0 +1,31 @@
+# utils/loggers.py
+
+import logging
+
+# Define a logging format that includes the date, time, level, function name, and the log message
+LOG_FORMAT = "%(asctime)s - %(levelname)s - [%(funcName)s] - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def setup_logger(name, level=logging.INFO):
+    """
+    Setup a console logger with the given name and level.
+
+    The logger does not propagate to the root logger, so each record is
+    emitted exactly once.
+
+    :param name: Logger name, usually __name__.
+    :param level: Logging level, e.g., logging.INFO, logging.DEBUG.
+    :return: Configured logger.
+    """
+
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    if not logger.handlers:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+        logger.addHandler(console_handler)
+
+    return logger